@@ -4,7 +4,8 @@ import irods
 import pytest
 from pytest import mark
 
-from ibridges.data_operations import Operations
+from ibridges.data_operations import Operations, upload
+from ibridges.executor import _query_tree_metadata
 from ibridges.meta import MetaData, MetaDataItem
 from ibridges.path import IrodsPath
 
@@ -68,6 +69,30 @@ def test_meta(item_name, request):
     assert ("y", "x") in meta
     meta.clear()
 
+@mark.parametrize("item_name", ["collection", "dataobject"])
+def test_metadata_cache(item_name, request, session):
+    item = request.getfixturevalue(item_name)
+    meta = MetaData(item)
+    meta.clear()
+    try:
+        assert len(meta) == 0
+        meta.add("some_key", "some_value")
+
+        # Metadata added through the python-irodsclient item is visible right away.
+        meta.item.metadata.add("other_key", "other_value")
+        assert ("other_key", "other_value") in meta
+        assert len(meta) == 2
+
+        # Metadata added elsewhere is visible after a refresh, also when there was none before.
+        for meta_key in ["third_key", "fourth_key"]:
+            IrodsPath(session, item.path).meta.add(meta_key, "some_value")
+            meta.refresh()
+            assert meta_key in meta
+            meta.clear()
+            assert len(meta) == 0
+    finally:
+        meta.clear()
+
 @mark.parametrize("item_name", ["collection", "dataobject"])
 def test_metadata_todict(item_name, request):
     item = request.getfixturevalue(item_name)
@@ -110,6 +135,39 @@ def test_metadata_export(item_name, request, session, tmpdir):
         new_meta_dict = json.load(tmp_file)
     assert isinstance(new_meta_dict, dict)
 
+def test_metadata_export_tree(session, collection, testdata):
+    root = IrodsPath(session, collection.path, "meta_archive")
+    sub_coll = root / "sub"
+    IrodsPath.create_collection(session, sub_coll)
+    upload(session, testdata / "bunny.rtf", root)
+    upload(session, testdata / "bunny.rtf", sub_coll)
+    all_paths = [root, sub_coll, root / "bunny.rtf", sub_coll / "bunny.rtf"]
+    try:
+        for i_path, ipath in enumerate(all_paths):
+            meta = ipath.meta
+            meta.add("some_key", f"value_{i_path}", "some_units")
+            meta.add("other_key", "other_value")
+            meta.item.metadata.add("org_ignored", "blacklisted_value")
+
+        # The bulk archive should be the same as the metadata of each item on its own.
+        with pytest.warns(UserWarning, match="org_ignored"):
+            tree_meta = _query_tree_metadata(root)
+        assert sorted(tree_meta) == sorted(str(ipath) for ipath in all_paths)
+        for ipath in all_paths:
+            with pytest.warns(UserWarning, match="org_ignored"):
+                item_meta = ipath.meta.to_dict()
+            item_type, tree_item_meta = tree_meta[str(ipath)]
+            assert item_type == ("data object" if ipath.dataobject_exists() else "collection")
+            assert sorted(tree_item_meta["metadata"]) == sorted(item_meta["metadata"])
+            assert ({key: val for key, val in tree_item_meta.items() if key != "metadata"}
+                    == {key: val for key, val in item_meta.items() if key != "metadata"})
+
+        # A data object has no tree to query.
+        assert _query_tree_metadata(root / "bunny.rtf") == {}
+    finally:
+        root.remove()
+
+
 @mark.parametrize("item_name", ["collection", "dataobject"])
 def test_metadata_getitem(item_name, request):
     item = request.getfixturevalue(item_name)
@@ -242,3 +300,22 @@ def test_metadata_errors(item_name, request, session):
     with pytest.raises(TypeError):
         meta.add("key", "value", 10)
 
+
+@mark.parametrize("item_name", ["collection", "dataobject"])
+def test_metadata_clear(item_name, request):
+    item = request.getfixturevalue(item_name)
+    meta = MetaData(item)
+    meta.clear()
+
+    for i_meta in range(5):
+        meta.add("some_key", f"value_{i_meta}", "some_units")
+    meta.add("other_key", "other_value")
+    meta.item.metadata.add("org_ignored", "blacklisted_value")
+    try:
+        assert len(meta) == 6
+
+        meta.clear()
+        assert len(meta) == 0
+        assert ("org_ignored", "blacklisted_value") in MetaData(meta.item, blacklist=None)
+    finally:
+        meta.item.metadata.remove("org_ignored", "blacklisted_value")
@@ -29,8 +29,9 @@ except ImportError:
 IBRIDGES_CONFIG_FP = Path.home() / ".ibridges" / "ibridges_cli.json"
 
 
-MAIN_HELP_MESSAGE = f"""
-iBridges CLI version {version("ibridges")}
+# The version is filled in when the help is shown, looking it up is relatively slow.
+MAIN_HELP_MESSAGE = """
+iBridges CLI version {version}
 
 Usage: ibridges [subcommand] [options]
 
@@ -102,7 +103,7 @@ def main() -> None:  #pylint: disable=too-many-branches
     subcommand = "--help" if len(sys.argv) < 2 else sys.argv.pop(1)
 
     if subcommand in ["-h", "--help"]:
-        print(MAIN_HELP_MESSAGE)
+        print(MAIN_HELP_MESSAGE.format(version=version("ibridges")))
     elif subcommand in ["-v", "--version"]:
         print(f"iBridges version {version('ibridges')}")
 
@@ -135,6 +136,10 @@ def main() -> None:  #pylint: disable=too-many-branches
         print(f"Invalid subcommand ({subcommand}). For help see ibridges --help")
         sys.exit(1)
 
+def _write_ibridges_conf(ibridges_conf: dict):
+    with open(IBRIDGES_CONFIG_FP, "w", encoding="utf-8") as handle:
+        json.dump(ibridges_conf, handle)
+
 def _get_ibridges_conf(ienv_path) -> dict:
     try:
         with open(IBRIDGES_CONFIG_FP, "r", encoding="utf-8") as handle:
@@ -146,8 +151,7 @@ def _get_ibridges_conf(ienv_path) -> dict:
         IBRIDGES_CONFIG_FP.parent.mkdir(exist_ok=True)
     return ibridges_conf
 
-def _set_alias(alias, ienv_path: Union[str, Path]):
-    ibridges_conf = _get_ibridges_conf(ienv_path)
+def _add_alias(ibridges_conf: dict, alias, ienv_path: Union[str, Path]):
     if "aliases" not in ibridges_conf:
         ibridges_conf["aliases"] = {}
     try:
@@ -157,14 +161,19 @@ def _set_alias(alias, ienv_path: Union[str, Path]):
         irodsa_backup = None
     ibridges_conf["aliases"][alias] = {"path": str(Path(ienv_path).absolute()),
                                        "irodsa_backup": irodsa_backup}
-    with open(IBRIDGES_CONFIG_FP, "w", encoding="utf-8") as handle:
-        json.dump(ibridges_conf, handle)
 
-def _set_ienv_path(ienv_path: Union[None, str, Path], alias: Optional[str] = None) -> Optional[str]:
+def _set_alias(alias, ienv_path: Union[str, Path]):
+    ibridges_conf = _get_ibridges_conf(ienv_path)
+    _add_alias(ibridges_conf, alias, ienv_path)
+    _write_ibridges_conf(ibridges_conf)
+
+def _set_ienv_path(ienv_path: Union[None, str, Path], alias: Optional[str] = None,
+                   ibridges_conf: Optional[dict] = None) -> Optional[str]:
     if ienv_path is None and alias is None:
         return None
 
-    ibridges_conf = _get_ibridges_conf(ienv_path)
+    if ibridges_conf is None:
+        ibridges_conf = _get_ibridges_conf(ienv_path)
 
     # Detect possible alias.
     if alias is None and str(ienv_path) in ibridges_conf.get("aliases", {}):
@@ -183,8 +192,7 @@ def _set_ienv_path(ienv_path: Union[None, str, Path], alias: Optional[str] = Non
     else:
         ibridges_conf["cli_last_env"] = None
 
-    with open(IBRIDGES_CONFIG_FP, "w", encoding="utf-8") as handle:
-        json.dump(ibridges_conf, handle)
+    _write_ibridges_conf(ibridges_conf)
     return ibridges_conf["cli_last_env"]
 
 
@@ -235,9 +243,12 @@ def ibridges_init():
         required=False,
     )
     args, _ = parser.parse_known_args()
+    ibridges_conf = None
     if args.alias is not None:
-        _set_alias(args.alias, args.irods_env_path)
-    _set_ienv_path(args.irods_env_path, args.alias)
+        # Add the alias and select it with a single write of the configuration file.
+        ibridges_conf = _get_ibridges_conf(args.irods_env_path)
+        _add_alias(ibridges_conf, args.alias, args.irods_env_path)
+    _set_ienv_path(args.irods_env_path, args.alias, ibridges_conf)
 
     with _cli_auth(ienv_path=_get_ienv_path()) as session:
         if not isinstance(session, Session):
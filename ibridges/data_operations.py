@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import os
 import warnings
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Optional, Union
 
 import irods.collection
@@ -111,15 +111,23 @@ def upload(
             local_path, idest_path, copy_empty_folders=copy_empty_folders, depth=None,
             overwrite=overwrite, ignore_err=ignore_err
         )
-        if not idest_path.collection_exists():
-            ops.add_create_coll(idest_path)
+        # _up_sync_operations has already listed idest_path and added it if missing.
         if not ipath.collection_exists():
             ops.add_create_coll(ipath)
     elif local_path.is_file():
         idest_path = ipath / local_path.name if ipath.collection_exists() else ipath
-        obj_exists = idest_path.dataobject_exists()
-        if not obj_exists or _transfer_needed(local_path, idest_path, overwrite, ignore_err):
+        # Fetch the data object once for both the size and the checksum comparison.
+        try:
+            dataobj = session.irods_session.data_objects.get(str(idest_path))
+        except DoesNotExistError:
+            dataobj = None
+        if dataobj is None:
             ops.add_upload(local_path, idest_path)
+        else:
+            idest_path = CachedIrodsPath(session, dataobj.size, True, dataobj.checksum,
+                                         str(idest_path))
+            if _transfer_needed(local_path, idest_path, overwrite, ignore_err):
+                ops.add_upload(local_path, idest_path)
 
     elif local_path.is_symlink():
         raise FileNotFoundError(
@@ -212,7 +220,26 @@ def download(
     irods_path = IrodsPath(session, irods_path)
     local_path = Path(local_path)
 
-    if irods_path.collection_exists():
+    # Fetch the data object once, instead of separate existence, checksum and size queries.
+    try:
+        dataobj = session.irods_session.data_objects.get(str(irods_path))
+    except DoesNotExistError:
+        # Also raised as CollectionDoesNotExist when the parent collection does not exist.
+        dataobj = None
+
+    if dataobj is not None:
+        irods_path = CachedIrodsPath(session, dataobj.size, True, dataobj.checksum,
+                                     str(irods_path))
+        ops = Operations()
+
+        if local_path.is_dir():
+            local_path = local_path / irods_path.name
+        if not local_path.is_file() or _transfer_needed(
+                irods_path, local_path, overwrite, ignore_err):
+            ops.add_download(irods_path, local_path)
+        if metadata is not None:
+            ops.add_meta_download(irods_path, irods_path, metadata)
+    elif irods_path.collection_exists():
         if local_path.is_file():
             raise NotADirectoryError(
                 f"Cannot download to directory {local_path} "
@@ -226,17 +253,6 @@ def download(
         )
         if not local_path.is_dir():
             ops.add_create_dir(Path(local_path))
-    elif irods_path.dataobject_exists():
-        ops = Operations()
-
-        if local_path.is_dir():
-            local_path = local_path / irods_path.name
-        if not local_path.is_file() or _transfer_needed(
-                irods_path, local_path, overwrite, ignore_err):
-            ops.add_download(irods_path, local_path)
-        if metadata is not None:
-            ops.add_meta_download(irods_path, irods_path, metadata)
-
     else:
         raise DoesNotExistError(f"Data object or collection not found: '{irods_path}'")
 
@@ -431,7 +447,7 @@ def create_meta_archive(session: Session, source: Union[str, IrodsPath],
                                     f"'{root_ipath}' does not exist.")
     operations = Operations()
     for ipath in root_ipath.walk():
-        operations.add_meta_download(root_ipath, ipath, meta_fp)
+        operations.add_meta_download(root_ipath, ipath, meta_fp, whole_tree=True)
     if not dry_run:
         operations.execute(session)
     return operations
@@ -520,6 +536,10 @@ def _transfer_needed(source: Union[IrodsPath, Path],
         warnings.warn(f"Skipping file/data object {source} -> {dest} since "
                       f"both exist and overwrite == False.")
         return False
+    # Files with different sizes always need a transfer, which saves hashing the local file.
+    # For a collection, the checksum comparison below raises an error instead.
+    if ipath.dataobject_exists() and ipath.size != lpath.stat().st_size:
+        return True
     if checksums_equal(ipath, lpath):
         return False
     return True
@@ -531,10 +551,12 @@ def _down_sync_operations(isource_path: IrodsPath, ldest_path: Path,
                           copy_empty_folders: bool  =True, depth: Optional[int] = None,
                           metadata: Union[None, str, Path] = None) -> Operations:
     operations = Operations()
+    # Expand the source path once, instead of for every item that is walked over.
+    isource_abs = PurePosixPath(str(isource_path))
     for ipath in isource_path.walk(depth=depth):
         if metadata is not None:
-            operations.add_meta_download(isource_path, ipath, metadata)
-        lpath = ldest_path.joinpath(*ipath.relative_to(isource_path).parts)
+            operations.add_meta_download(isource_path, ipath, metadata, whole_tree=depth is None)
+        lpath = ldest_path.joinpath(*PurePosixPath(str(ipath)).relative_to(isource_abs).parts)
         if ipath.dataobject_exists():
             if lpath.is_file():
                 if _transfer_needed(ipath, lpath, overwrite, ignore_err):
@@ -561,8 +583,6 @@ def _up_sync_operations(lsource_path: Path, idest_path: IrodsPath,  # pylint: di
         remote_ipaths = {}
     for root, folders, files in os.walk(lsource_path):
         root_part = Path(root).relative_to(lsource_path)
-        if depth is not None and len(root_part.parts) > depth:
-            continue
         root_ipath = idest_path.joinpath(*root_part.parts)
         for cur_file in files:
             ipath = root_ipath / cur_file
@@ -590,4 +610,7 @@ def _up_sync_operations(lsource_path: Path, idest_path: IrodsPath,  # pylint: di
                     operations.add_create_coll(root_ipath / fold)
         if str(root_ipath) not in remote_ipaths:
             operations.add_create_coll(root_ipath)
+        if depth is not None and len(root_part.parts) >= depth:
+            # Deeper folders are not synchronized, so don't let os.walk descend into them.
+            folders.clear()
     return operations
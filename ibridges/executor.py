@@ -2,23 +2,31 @@
 from __future__ import annotations
 
 import json
+import queue
+import re
+import threading
 import warnings
 from collections import defaultdict
 from inspect import signature
-from pathlib import Path
-from typing import Optional, Union
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Optional, Union
 
 import irods.collection
 import irods.data_object
 import irods.exception
 import irods.keywords as kw
-from tqdm import tqdm
-from tqdm.std import tqdm as tqdm_type
 
+import ibridges.icat_columns as icat
+from ibridges.meta import DEFAULT_BLACKLIST
 from ibridges.path import IrodsPath
 from ibridges.session import Session
 
+if TYPE_CHECKING:
+    from tqdm.std import tqdm as tqdm_type
+
 NUM_THREADS = 4
+NUM_TRANSFER_WORKERS = 4
+MAX_OUTSTANDING_TRANSFERS = 16
 
 
 class Operations():  # pylint: disable=too-many-instance-attributes
@@ -57,12 +65,13 @@ class Operations():  # pylint: disable=too-many-instance-attributes
         self.create_collection: set[str] = set()
         self.upload: list[tuple[Path, IrodsPath]] = []
         self.download: list[tuple[IrodsPath, Path]] = []
-        self.meta_download: dict = defaultdict(lambda: {"items": []})
+        self.meta_download: dict = defaultdict(lambda: {"items": [], "whole_tree": True})
         self.meta_upload: list[tuple[IrodsPath, Union[str, Path]]] = []
         self.resc_name: str = "" if resc_name is None else resc_name
         self.options: Optional[dict] = {} if resc_name is None else options
 
-    def add_meta_download(self, root_ipath: IrodsPath, ipath: IrodsPath, meta_fp: Union[str, Path]):
+    def add_meta_download(self, root_ipath: IrodsPath, ipath: IrodsPath, meta_fp: Union[str, Path],
+                          whole_tree: bool = False):
         """Add operation for downloading metadata archives.
 
         This basic operation adds one IrodsPath point to either a collection or data object for
@@ -76,10 +85,15 @@ class Operations():  # pylint: disable=too-many-instance-attributes
             Irods path for which the metadata needs to be downloaded.
         meta_fp
             File to store the metadata in.
+        whole_tree, optional
+            Whether all items below the root are added to the archive, by default False.
+            The metadata of a whole tree is retrieved with a few bulk queries, otherwise
+            it is retrieved per item.
 
         """
         self.meta_download[str(meta_fp)]["root_ipath"] = root_ipath
         self.meta_download[str(meta_fp)]["items"].append(ipath)
+        self.meta_download[str(meta_fp)]["whole_tree"] &= whole_tree
 
     def add_meta_upload(self, root_ipath: IrodsPath, meta_fp: Union[str, Path]):
         """Add operation to use a metadata archive.
@@ -148,7 +162,7 @@ class Operations():  # pylint: disable=too-many-instance-attributes
         self.create_collection.add(str(new_col))
 
     def execute(self, session: Session, ignore_err: bool = False,
-                progress_bar: bool = True):
+                progress_bar: bool = True, verify_checksum: bool = True):
         """Execute all added operations.
 
         This also creates a progress bar to see the status updates.
@@ -163,8 +177,15 @@ class Operations():  # pylint: disable=too-many-instance-attributes
         progress_bar
             Whether to turn on the progress bar. The progress bar will be disabled
             if the total download + upload size is 0 regardless.
+        verify_checksum
+            Whether to verify the checksum of each transferred file against iRODS, by default
+            True. Skipping this saves hashing every file locally, while the server still
+            registers the checksums of uploaded data objects.
 
         """
+        # Importing tqdm is relatively slow, so only do it when operations are executed.
+        from tqdm import tqdm  # pylint: disable=import-outside-toplevel
+
         up_sizes = [lpath.stat().st_size for lpath, _ in self.upload]
         down_sizes = [ipath.size for ipath, _ in self.download]
         disable = len(up_sizes) + len(down_sizes) == 0 or not progress_bar
@@ -177,13 +198,15 @@ class Operations():  # pylint: disable=too-many-instance-attributes
         )
         self.execute_create_dir()
         self.execute_create_coll(session)
-        self.execute_download(session, pbar, ignore_err=ignore_err)
-        self.execute_upload(session, pbar, ignore_err=ignore_err)
+        self.execute_download(session, pbar, ignore_err=ignore_err,
+                              verify_checksum=verify_checksum)
+        self.execute_upload(session, pbar, ignore_err=ignore_err,
+                            verify_checksum=verify_checksum)
         self.execute_meta_download()
         self.execute_meta_upload()
 
-    def execute_download(self, session: Session,
-                         pbar: Optional[tqdm_type], ignore_err: bool = False):
+    def execute_download(self, session: Session, pbar: Optional[tqdm_type],
+                         ignore_err: bool = False, verify_checksum: bool = True):
         """Execute all download operations.
 
         Parameters
@@ -196,22 +219,23 @@ class Operations():  # pylint: disable=too-many-instance-attributes
             The progress bar to be updated.
         ignore_err, optional
             Whether to ignore errors when encountered, by default False.
+        verify_checksum, optional
+            Whether to verify the checksums of the downloaded files, by default True.
 
         """
-        for ipath, lpath in self.download:
-            _obj_get(
-                session,
-                ipath,
-                lpath,
-                overwrite=True,
-                ignore_err=ignore_err,
-                options=self.options,
-                resc_name=self.resc_name,
-                pbar=pbar,
-            )
+        _transfer_files(
+            _obj_get,
+            session,
+            self.download,
+            ignore_err=ignore_err,
+            options=self.options,
+            resc_name=self.resc_name,
+            pbar=pbar,
+            verify_checksum=verify_checksum,
+        )
 
-    def execute_upload(self, session: Session,
-                       pbar: Optional[tqdm_type], ignore_err: bool = False):
+    def execute_upload(self, session: Session, pbar: Optional[tqdm_type],
+                       ignore_err: bool = False, verify_checksum: bool = True):
         """Execute all upload operations.
 
         Parameters
@@ -224,26 +248,32 @@ class Operations():  # pylint: disable=too-many-instance-attributes
             Progress bar to be updated while uploading.
         ignore_err
             Whether to ignore errors when encountered, by default False.
+        verify_checksum
+            Whether to verify the checksums of the uploaded files, by default True.
 
         """
-        for lpath, ipath in self.upload:
-            _obj_put(
-                session,
-                lpath,
-                ipath,
-                overwrite=True,
-                ignore_err=ignore_err,
-                options=self.options,
-                resc_name=self.resc_name,
-                pbar=pbar,
-            )
+        _transfer_files(
+            _obj_put,
+            session,
+            self.upload,
+            ignore_err=ignore_err,
+            options=self.options,
+            resc_name=self.resc_name,
+            pbar=pbar,
+            verify_checksum=verify_checksum,
+        )
 
     def execute_meta_download(self):
         """Execute all metadata download operations."""
         for meta_fp, op in self.meta_download.items():
-            meta_dict = _empty_metadict(op["root_ipath"])
+            root_ipath = op["root_ipath"]
+            # The root is the same for all items, so only expand it once.
+            root_path = str(root_ipath)
+            meta_dict = _empty_metadict(root_ipath)
+            # The bulk queries fetch the whole tree, which only pays off if it is all needed.
+            tree_meta = _query_tree_metadata(root_ipath) if op["whole_tree"] else None
             for ipath in op["items"]:
-                _add_to_metadict(meta_dict, ipath, op["root_ipath"])
+                _add_to_metadict(meta_dict, ipath, root_path, tree_meta)
             with open(meta_fp, "w", encoding="utf-8") as handle:
                 json.dump(meta_dict, handle, indent=4)
 
@@ -285,7 +315,11 @@ class Operations():  # pylint: disable=too-many-instance-attributes
             Session to create the collections with.
 
         """
-        for col in self.create_collection:
+        # Collections are created together with their parents, so skip the parents
+        # of other collections that will be created anyway.
+        ancestors = {str(parent) for col in self.create_collection
+                     for parent in PurePosixPath(col).parents}
+        for col in self.create_collection - ancestors:
             IrodsPath.create_collection(session, col)
 
     def print_summary(self):
@@ -305,33 +339,128 @@ class Operations():  # pylint: disable=too-many-instance-attributes
 
         if len(self.upload) > 0:
             summary = "Upload files:\n\n"
-            for lpath, ipath in self.upload:
-                summary += f"{lpath} -> {ipath}\n"
+            summary += "".join(f"{lpath} -> {ipath}\n" for lpath, ipath in self.upload)
             summary_strings.append(summary)
 
         if len(self.download) > 0:
             summary = "Download files:\n\n"
-            for ipath, lpath in self.download:
-                summary += f"{ipath} -> {lpath}\n"
+            summary += "".join(f"{ipath} -> {lpath}\n" for ipath, lpath in self.download)
             summary_strings.append(summary)
 
         if len(self.meta_download) > 0:
-            summary = "Metadata to download:\n\n"
+            lines = ["Metadata to download:\n\n"]
             for meta_fp, meta_item in self.meta_download.items():
-                summary += f"- Destination: {meta_fp}\n"
-                summary += f"- Root iRODS path: {meta_item['root_ipath']}\n\n"
-                for item in meta_item["items"]:
-                    summary += f"{item}\n"
-            summary_strings.append(summary)
+                lines.append(f"- Destination: {meta_fp}\n")
+                lines.append(f"- Root iRODS path: {meta_item['root_ipath']}\n\n")
+                lines.extend(f"{item}\n" for item in meta_item["items"])
+            summary_strings.append("".join(lines))
 
         if len(self.meta_upload) > 0:
             summary = "Metadata to upload:\n\n"
-            for (ipath, meta_fp) in self.meta_upload:
-                summary += f"{meta_fp} -> {ipath}\n"
+            summary += "".join(f"{meta_fp} -> {ipath}\n" for ipath, meta_fp in self.meta_upload)
             summary_strings.append(summary)
         print("\n\n".join(summary_strings))
 
 
+def _transfer_files(transfer_func, session: Session, transfers: list, ignore_err: bool,
+                    options: Optional[dict], resc_name: str, pbar: Optional[tqdm_type],
+                    verify_checksum: bool = True):
+    """Transfer several files at the same time.
+
+    Parameters
+    ----------
+    transfer_func
+        Function that transfers a single file, either :func:`_obj_put` or :func:`_obj_get`.
+    session
+        Session to perform the transfers with.
+    transfers
+        List of (source, destination) pairs.
+    ignore_err
+        Whether to ignore errors when encountered.
+    options
+        Extra options to the python irodsclient put/get methods.
+    resc_name
+        Name of the resource to use.
+    pbar
+        Progress bar to be updated while transferring.
+    verify_checksum
+        Whether to verify the checksums of the transferred files.
+
+    Raises
+    ------
+    Exception:
+        The first error raised by one of the transfers. Transfers that have not
+        started yet are cancelled, the running ones are finished first. The same
+        happens when the transfer is interrupted, e.g. by Ctrl-C.
+
+    """
+    def _transfer(source, dest):
+        # The options are modified for each file, so every transfer gets its own copy.
+        transfer_func(session, source, dest, overwrite=True, ignore_err=ignore_err,
+                      options=None if options is None else dict(options),
+                      resc_name=resc_name, pbar=pbar, verify_checksum=verify_checksum)
+
+    if len(transfers) <= 1 or NUM_TRANSFER_WORKERS <= 1:
+        for source, dest in transfers:
+            _transfer(source, dest)
+        return
+
+    _transfer_concurrently(_transfer, transfers)
+
+
+def _transfer_concurrently(transfer, transfers: list):
+    """Run the transfers on NUM_TRANSFER_WORKERS threads, see :func:`_transfer_files`."""
+    # The python irodsclient takes a separate connection from its pool for each transfer.
+    # Only a limited number of transfers is queued at any time, so that an error stops
+    # the remaining transfers quickly. There is always room for a stop signal per worker.
+    n_workers = min(NUM_TRANSFER_WORKERS, len(transfers))
+    todo: queue.Queue = queue.Queue(maxsize=max(MAX_OUTSTANDING_TRANSFERS, n_workers))
+    stop = threading.Event()
+    errors: list[BaseException] = []
+
+    def _worker():
+        while True:
+            item = todo.get()
+            if item is None:
+                return
+            if stop.is_set():
+                continue
+            try:
+                transfer(*item)
+            except BaseException as exc:  # pylint: disable=broad-exception-caught
+                errors.append(exc)
+                stop.set()
+
+    workers = [threading.Thread(target=_worker) for _ in range(n_workers)]
+    for worker in workers:
+        worker.start()
+    try:
+        for item in transfers:
+            if stop.is_set():
+                break
+            todo.put(item)
+        for _ in workers:
+            todo.put(None)
+        for worker in workers:
+            worker.join()
+    except BaseException:
+        stop.set()
+        # Drop the queued transfers, and wait for the running ones, so that no files or
+        # data objects are still being written when the caller gets control back.
+        while True:
+            try:
+                todo.get_nowait()
+            except queue.Empty:
+                break
+        for _ in workers:
+            todo.put_nowait(None)
+        for worker in workers:
+            worker.join()
+        raise
+    if errors:
+        raise errors[0]
+
+
 def _obj_put(  # pylint: disable=too-many-branches
     session: Session,
     local_path: Union[str, Path],
@@ -341,6 +470,7 @@ def _obj_put(  # pylint: disable=too-many-branches
     options: Optional[dict] = None,
     ignore_err: bool = False,
     pbar: Optional[tqdm_type] = None,
+    verify_checksum: bool = True,
 ):
     """Upload `local_path` to `irods_path` following iRODS `options`.
 
@@ -362,6 +492,8 @@ def _obj_put(  # pylint: disable=too-many-branches
         If True, convert errors into warnings.
     pbar:
         Optional progress bar.
+    verify_checksum:
+        Whether to verify the checksum of the uploaded data object against the local file.
 
     """
     local_path = Path(local_path)
@@ -374,15 +506,17 @@ def _obj_put(  # pylint: disable=too-many-branches
         warnings.warn(err_msg)
         return
 
-    # Check if irods object already exists
-    obj_exists = (
+    # Check if irods object already exists, which only matters if we cannot overwrite it
+    obj_exists = not overwrite and (
         IrodsPath(session, irods_path / local_path.name).dataobject_exists()
         or irods_path.dataobject_exists()
     )
 
     if options is None:
         options = {}
-    options.update({kw.NUM_THREADS_KW: NUM_THREADS, kw.REG_CHKSUM_KW: "", kw.VERIFY_CHKSUM_KW: ""})
+    options.update({kw.NUM_THREADS_KW: NUM_THREADS, kw.REG_CHKSUM_KW: ""})
+    if verify_checksum:
+        options[kw.VERIFY_CHKSUM_KW] = ""
 
     if pbar is not None:
         upd_put = "updatables" in signature(session.irods_session.data_objects.put).parameters
@@ -425,7 +559,8 @@ def _obj_put(  # pylint: disable=too-many-branches
         warnings.warn(f"Cannot overwrite dataobject with name '{local_path.name}',"
                       "it already exists. Use overwrite=False to suppress this warning.")
     if pbar is not None and not upd_put:
-        pbar.update(IrodsPath(session, irods_path).size)
+        # The local size is what was transferred, and is known without querying iRODS.
+        pbar.update(local_path.stat().st_size)
 
 
 def _obj_get(
@@ -437,6 +572,7 @@ def _obj_get(
     options: Optional[dict] = None,
     ignore_err: bool = False,
     pbar: Optional[tqdm_type] = None,
+    verify_checksum: bool = True,
 ):
     """Download `irods_path` to `local_path` following iRODS `options`.
 
@@ -458,16 +594,15 @@ def _obj_get(
         If True, convert errors into warnings.
     pbar:
         Optional progress bar.
+    verify_checksum:
+        Whether to verify the checksum of the downloaded file against the data object.
 
     """
     if options is None:
         options = {}
-    options.update(
-        {
-            kw.NUM_THREADS_KW: NUM_THREADS,
-            kw.VERIFY_CHKSUM_KW: "",
-        }
-    )
+    options[kw.NUM_THREADS_KW] = NUM_THREADS
+    if verify_checksum:
+        options[kw.VERIFY_CHKSUM_KW] = ""
     if overwrite:
         options[kw.FORCE_FLAG_KW] = ""
     if resc_name not in ["", None]:
@@ -499,7 +634,8 @@ def _obj_get(
         pbar.update(IrodsPath(session, irods_path).size)
 
 
-def _add_to_metadict(meta_dict: dict, ipath: IrodsPath, root_ipath: IrodsPath):
+def _add_to_metadict(meta_dict: dict, ipath: IrodsPath, root_path: str,
+                     tree_meta: Optional[dict[str, tuple[str, dict]]] = None):
     """Add an item to the metadata archive dictionary.
 
     Parameters
@@ -508,26 +644,127 @@ def _add_to_metadict(meta_dict: dict, ipath: IrodsPath, root_ipath: IrodsPath):
         Dictionary to add the new item to.
     ipath
         IrodsPath to the item that the metadata is extracted from.
-    root_ipath
-        Root IrodsPath to which the relative path is calculated.
+    root_path
+        Absolute path of the root to which the relative path is calculated.
+    tree_meta
+        Prefetched item types and metadata, see :func:`_query_tree_metadata`.
+        Items that are not in it are retrieved from the server one by one.
 
     """
-    meta = ipath.meta
-    if ipath.collection_exists():
-        item_type = "collection"
-    elif ipath.dataobject_exists():
-        item_type = "data object"
+    abs_path = str(ipath)
+    if tree_meta is not None and abs_path in tree_meta:
+        item_type, item_meta = tree_meta[abs_path]
     else:
-        item_type = "unknown"
+        meta = ipath.meta
+        if isinstance(meta.item, irods.collection.iRODSCollection):
+            item_type = "collection"
+        elif isinstance(meta.item, irods.data_object.iRODSDataObject):
+            item_type = "data object"
+        else:
+            item_type = "unknown"
+        item_meta = meta.to_dict()
 
     new_metadata = {
-        "rel_path": str(ipath.relative_to(root_ipath)),
+        "rel_path": _relative_path(abs_path, root_path),
         "type": item_type,
     }
-    new_metadata.update(meta.to_dict())
+    new_metadata.update(item_meta)
     meta_dict["items"].append(new_metadata)
 
 
+def _relative_path(abs_path: str, root_path: str) -> str:
+    # Both paths are absolute and normalized, so the relative path is a suffix of abs_path.
+    if abs_path == root_path:
+        return "."
+    root_prefix = root_path.rstrip("/") + "/"
+    if abs_path.startswith(root_prefix):
+        return abs_path[len(root_prefix):]
+    return str(PurePosixPath(abs_path).relative_to(root_path))
+
+
+def _query_tree_metadata(root_ipath: IrodsPath) -> dict[str, tuple[str, dict]]:
+    """Retrieve the metadata of a collection and everything below it in bulk.
+
+    Instead of fetching every item and then its metadata, this uses a fixed number of
+    queries for the whole tree. The entries have the same format as :meth:`MetaData.to_dict`
+    with the default blacklist.
+
+    Parameters
+    ----------
+    root_ipath
+        Root collection of the tree.
+
+    Returns
+    -------
+        Dictionary with the absolute paths as keys, and the item type together with the
+        metadata dictionary as values. Empty if the root is not a collection.
+
+    """
+    irods_session = root_ipath.session.irods_session
+    blacklist = re.compile(DEFAULT_BLACKLIST)
+    root = str(root_ipath)
+    tree_meta: dict[str, tuple[str, dict]] = {}
+
+    def _coll_filters():
+        # Create new filters for each query, the root and everything below it.
+        return [icat.COLL_NAME == root, icat.LIKE(icat.COLL_NAME, root + "/%")]
+
+    for coll_filter in _coll_filters():
+        query = irods_session.query(icat.COLL_NAME, icat.COLL_ID).filter(coll_filter)
+        for res in query:
+            tree_meta[res[icat.COLL_NAME]] = ("collection", {
+                "name": res[icat.COLL_NAME].rsplit("/", maxsplit=1)[-1],
+                "irods_id": res[icat.COLL_ID],
+                "metadata": [],
+            })
+        if not tree_meta:
+            # The root is not a collection (e.g. a data object), so there is no tree to query.
+            return tree_meta
+    for coll_filter in _coll_filters():
+        query = irods_session.query(
+            icat.COLL_NAME, icat.DATA_NAME, icat.DATA_ID, icat.DATA_CHECKSUM
+        ).filter(coll_filter)
+        for res in query:
+            # Replicas give one row each, the first one is used like for iRODSDataObject.
+            tree_meta.setdefault(res[icat.COLL_NAME] + "/" + res[icat.DATA_NAME], ("data object", {
+                "name": res[icat.DATA_NAME],
+                "irods_id": res[icat.DATA_ID],
+                "checksum": res[icat.DATA_CHECKSUM],
+                "metadata": [],
+            }))
+    for coll_filter in _coll_filters():
+        query = irods_session.query(
+            icat.COLL_NAME, icat.META_COLL_ATTR_NAME, icat.META_COLL_ATTR_VALUE,
+            icat.META_COLL_ATTR_UNITS
+        ).filter(coll_filter)
+        for res in query:
+            _add_avu(tree_meta, res[icat.COLL_NAME], blacklist, res[icat.META_COLL_ATTR_NAME],
+                     res[icat.META_COLL_ATTR_VALUE], res[icat.META_COLL_ATTR_UNITS])
+    for coll_filter in _coll_filters():
+        query = irods_session.query(
+            icat.COLL_NAME, icat.DATA_NAME, icat.META_DATA_ATTR_NAME, icat.META_DATA_ATTR_VALUE,
+            icat.META_DATA_ATTR_UNITS
+        ).filter(coll_filter)
+        for res in query:
+            _add_avu(tree_meta, res[icat.COLL_NAME] + "/" + res[icat.DATA_NAME], blacklist,
+                     res[icat.META_DATA_ATTR_NAME], res[icat.META_DATA_ATTR_VALUE],
+                     res[icat.META_DATA_ATTR_UNITS])
+    return tree_meta
+
+
+def _add_avu(tree_meta: dict[str, tuple[str, dict]], path: str, blacklist: re.Pattern,
+             key: str, value: str, units: Optional[str]):
+    if path not in tree_meta:
+        return
+    if blacklist.match(key) is not None:
+        warnings.warn(
+            f"Ignoring metadata entry with key {key}, because it matches "
+            f"the blacklist {blacklist.pattern}."
+        )
+        return
+    tree_meta[path][1]["metadata"].append((key, value, "" if units is None else units))
+
+
 def _empty_metadict(root_ipath: IrodsPath, recursive: bool = True) -> dict:
     """Create an empty dictionary for metadata archival.
 
@@ -23,6 +23,10 @@ def _parse_tuple(key, value, units = ""):
     if not isinstance(units, (str, bytes, type(None))):
         raise TypeError(f"Key should have type str, bytes-like or None, not {type(units)}.")
 
+DEFAULT_BLACKLIST = r"^org_[\s\S]+"
+_DEFAULT_BLACKLIST_RE = re.compile(DEFAULT_BLACKLIST)
+
+
 class MetaData:
     """iRODS metadata operations.
 
@@ -60,26 +64,77 @@ class MetaData:
     def __init__(
         self,
         item: Union[irods.data_object.iRODSDataObject, irods.collection.iRODSCollection],
-        blacklist: Optional[str] = r"^org_[\s\S]+",
+        blacklist: Optional[str] = DEFAULT_BLACKLIST,
     ):
         """Initialize the metadata object."""
         self.item = item
         self.blacklist = blacklist
+        self._prc_meta_coll: Optional[irods.meta.iRODSMetaCollection] = None
+
+    @property
+    def blacklist(self) -> Optional[str]:
+        """Regular expression for metadata keys that are ignored, None to allow all keys."""
+        return self._blacklist
+
+    @blacklist.setter
+    def blacklist(self, blacklist: Optional[str]):
+        self._blacklist = blacklist
+        # Compile once here instead of on every metadata entry that is checked.
+        self._blacklist_re: Optional[re.Pattern]
+        if blacklist == DEFAULT_BLACKLIST:
+            self._blacklist_re = _DEFAULT_BLACKLIST_RE
+        else:
+            self._blacklist_re = re.compile(blacklist) if blacklist else None
+        self._filtered_cache: Optional[tuple[list, list]] = None
+
+    @property
+    def _prc_metadata(self) -> irods.meta.iRODSMetaCollection:
+        """Metadata collection of the python-irodsclient item.
+
+        The python-irodsclient queries the server again each time the metadata of an item without
+        any metadata is accessed, so the reference is kept while it is empty. Non-empty metadata
+        is always taken from the item, which returns it without querying the server.
+        """
+        if self._prc_meta_coll is not None and not self._prc_meta_coll:
+            return self._prc_meta_coll
+        meta_coll = self.item.metadata
+        self._prc_meta_coll = None if meta_coll else meta_coll
+        return meta_coll
+
+    def _filtered_items(self) -> list:
+        """Get the python-irodsclient metadata entries that are not on the blacklist.
+
+        The python-irodsclient replaces its list of entries after every change, so the
+        filtered list is kept for as long as that list stays the same.
+        """
+        prc_items = self._prc_metadata.items()
+        if self._filtered_cache is not None and self._filtered_cache[0] is prc_items:
+            return self._filtered_cache[1]
+
+        if self._blacklist_re is None:
+            filtered_items = list(prc_items)
+        else:
+            filtered_items = []
+            blacklist_match = self._blacklist_re.match
+            for meta in prc_items:
+                if blacklist_match(meta.name) is None:
+                    filtered_items.append(meta)
+                else:
+                    warnings.warn(
+                        f"Ignoring metadata entry with key {meta.name}, because it matches "
+                        f"the blacklist {self.blacklist}."
+                    )
+        self._filtered_cache = (prc_items, filtered_items)
+        return filtered_items
 
     def __iter__(self) -> Iterator:
         """Iterate over all metadata key/value/units triplets."""
-        for meta in self.item.metadata.items():
-            if not self.blacklist or re.match(self.blacklist, meta.name) is None:
-                yield MetaDataItem(self, meta)
-            else:
-                warnings.warn(
-                    f"Ignoring metadata entry with key {meta.name}, because it matches "
-                    f"the blacklist {self.blacklist}."
-                )
+        for meta in self._filtered_items():
+            yield MetaDataItem(self, meta)
 
     def __len__(self) -> int:
         """Get the number of non-blacklisted metadata entries."""
-        return len([x for x in self])  # pylint: disable=unnecessary-comprehension
+        return len(self._filtered_items())
 
     def __contains__(self, val: Union[str, Sequence]) -> bool:
         """Check whether a key, key/val, key/val/units pairs are in the metadata.
@@ -99,9 +154,7 @@ class MetaData:
 
         """
         search_pattern = _pad_search_pattern(val)
-        if len(self.find_all(*search_pattern)) > 0:
-            return True
-        return False
+        return any(meta_item.matches(*search_pattern) for meta_item in self)
 
     def __repr__(self) -> str:
         """Create a sorted representation of the metadata."""
@@ -110,7 +163,7 @@ class MetaData:
     def __str__(self) -> str:
         """Return a string showing all metadata entries."""
         # Sort the list of items name -> value -> units, where None is the lowest
-        meta_list = sorted(list(self))
+        meta_list = sorted(self, key=_meta_sort_key)
         return "\n".join(f" - {meta}" for meta in meta_list)
 
     def find_all(self, key=..., value=..., units=...):
@@ -223,14 +276,8 @@ class MetaData:
         try:
             if (key, value, units) in self:
                 raise ValueError("ADD META: Metadata already present")
-            if self.blacklist:
-                try:
-                    if re.match(self.blacklist, key):
-                        raise ValueError(f"ADD META: Key must not start with {self.blacklist}.")
-                except TypeError as error:
-                    raise TypeError(
-                            f"Key {key} must be of type string, found {type(key)}") from error
-            self.item.metadata.add(key, value, units)
+            self._check_blacklist(key)
+            self._prc_metadata.add(key, value, units)
         except irods.exception.CAT_NO_ACCESS_PERMISSION as error:
             raise PermissionError("UPDATE META: no permissions") from error
 
@@ -266,8 +313,29 @@ class MetaData:
                       f"You can mimick the old behavior with meta.delete('{key}'); "
                       f"meta.add('{key}', '{value}', '{units}')",
                       DeprecationWarning, stacklevel=2)
-        self.delete(key)
-        self.add(key, value, units)
+        _parse_tuple(key, value, units)
+        self._check_blacklist(key)
+        all_meta_items = self.find_all(key)
+        if len(all_meta_items) == 0:
+            raise KeyError(
+                f"Cannot delete items with key='{key}', value='...' and units='...', "
+                "since no metadata entries exist with those values."
+            )
+        # Remove the old entries and add the new one in a single request.
+        avu_ops = [irods.meta.AVUOperation(operation="remove", avu=irods.meta.iRODSMeta(*meta))
+                   for meta in all_meta_items]
+        avu_ops.append(irods.meta.AVUOperation(operation="add",
+                                               avu=irods.meta.iRODSMeta(key, value, units)))
+        self._apply_atomic_operations(avu_ops)
+
+    def _check_blacklist(self, key: str):
+        if self._blacklist_re is None:
+            return
+        try:
+            if self._blacklist_re.match(key):
+                raise ValueError(f"ADD META: Key must not start with {self.blacklist}.")
+        except TypeError as error:
+            raise TypeError(f"Key {key} must be of type string, found {type(key)}") from error
 
     def delete(
         self,
@@ -335,8 +403,10 @@ class MetaData:
 
         """
         self.refresh()
-        for meta in self:
-            self.item.metadata.remove(meta)
+        self._apply_atomic_operations(
+            [irods.meta.AVUOperation(operation="remove", avu=irods.meta.iRODSMeta(*meta))
+             for meta in self]
+        )
 
     def to_dict(self, keys: Optional[list] = None) -> dict:
         """Convert iRODS metadata (AVUs) and system information to a python dictionary.
@@ -387,6 +457,11 @@ class MetaData:
             Dictionary that contains all the key, value, units triples. This
             should use the same format as the output of the to_dict method.
 
+        Raises
+        ------
+        TypeError:
+            If the key, value or units of an entry have the wrong type. No entries are added.
+
         Examples
         --------
         >>> meta.add("Ben", "10", "kg")
@@ -399,21 +474,54 @@ class MetaData:
         - {name: Ben, value: 10, units: kg}
 
         """
+        # Skip the same entries add would refuse, and add the others in a single request.
+        # Entries of the wrong type raise a TypeError before anything is sent to the server.
+        present = {tuple(meta) for meta in self}
+        avu_ops = []
         for meta_tuple in meta_dict["metadata"]:
+            key, value, units = _meta_triple(*meta_tuple)
             try:
-                self.add(*meta_tuple)
+                _parse_tuple(key, value, units)
+                self._check_blacklist(key)
             except ValueError:
-                pass
+                continue
+            new_item = (key, value, "" if units is None else units)
+            if new_item in present:
+                continue
+            present.add(new_item)
+            avu_ops.append(irods.meta.AVUOperation(operation="add",
+                                                   avu=irods.meta.iRODSMeta(key, value, units)))
+        self._apply_atomic_operations(avu_ops)
+
+    def _apply_atomic_operations(self, avu_ops: list):
+        """Apply a batch of metadata operations in one request to the iRODS server.
+
+        The server applies either all operations or none of them.
+
+        Raises
+        ------
+        PermissionError:
+            If the user has insufficient permissions to change the metadata.
+
+        """
+        if len(avu_ops) == 0:
+            return
+        try:
+            self._prc_metadata.apply_atomic_operations(*avu_ops)
+        except irods.exception.CAT_NO_ACCESS_PERMISSION as error:
+            raise PermissionError("UPDATE META: no permissions") from error
 
     def refresh(self):
         """Refresh the metadata of the item.
 
-        This is only necessary if the metadata has been modified by another session.
+        This is only necessary if the metadata has been modified by another session, or
+        through the python-irodsclient item while the item did not have any metadata.
         """
         if isinstance(self.item, irods.collection.iRODSCollection):
             self.item = self.item.manager.sess.collections.get(self.item.path)
         else:
             self.item = self.item.manager.sess.data_objects.get(self.item.path)
+        self._prc_meta_coll = None
 
 
 class MetaDataItem:
@@ -591,6 +699,15 @@ def _comp_str_none(obj: Optional[str], other: Optional[str]) -> Optional[bool]:
     return str(obj) < str(other)
 
 
+def _meta_triple(key, value, units = "") -> tuple:
+    return key, value, units
+
+
+def _meta_sort_key(meta_item: MetaDataItem) -> tuple:
+    # Same order as MetaDataItem.__lt__, computed once per item instead of per comparison.
+    return tuple((elem is not None, str(elem)) for elem in meta_item)
+
+
 def _pad_search_pattern(search_pattern) -> tuple:
     if isinstance(search_pattern, str):
         padded_pattern = (search_pattern, ..., ...)
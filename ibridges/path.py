@@ -7,6 +7,8 @@ from pathlib import PurePosixPath
 from typing import Iterable, Optional, Union
 
 import irods
+import irods.collection
+import irods.data_object
 from irods.models import DataObject
 
 import ibridges.icat_columns as icat
@@ -102,6 +104,9 @@ class IrodsPath:
 
     def __str__(self) -> str:
         """Get the absolute path if converting to string."""
+        if self._path.parts[:1] == ("/",):
+            # Already absolute, so skip building a new IrodsPath.
+            return str(self._path)
         return str(self.absolute()._path)
 
     def __repr__(self) -> str:
@@ -254,7 +259,9 @@ class IrodsPath:
         >>> IrodsPath(session, "~/some_collection").rename("~/new_collection")
 
         """
-        if not self.exists():
+        # Probe the type once, it is needed both to check existence and to pick the move.
+        is_dataobj = self.dataobject_exists()
+        if not is_dataobj and not self.collection_exists():
             raise DoesNotExistError(f"{str(self)} does not exist.")
 
         # Build new path
@@ -268,7 +275,7 @@ class IrodsPath:
             if not new_path.parent.exists():
                 self.create_collection(self.session, new_path.parent)
 
-            if self.dataobject_exists():
+            if is_dataobj:
                 self.session.irods_session.data_objects.move(str(self), str(new_path))
             else:
                 self.session.irods_session.collections.move(str(self), str(new_path))
@@ -350,8 +357,10 @@ class IrodsPath:
         <iRODSCollection 21260050 b'some_collection'>
 
         """
-        if self.collection_exists():
+        try:
             return self.session.irods_session.collections.get(str(self))
+        except CollectionDoesNotExistError:
+            pass
         if self.dataobject_exists():
             raise NotACollectionError(
                 "Error retrieving collection, path is linked to a data object."
@@ -379,15 +388,17 @@ class IrodsPath:
         <iRODSDataObject 24490075 some_dataobj.txt>
 
         """
-        if self.dataobject_exists():
+        try:
             return self.session.irods_session.data_objects.get(str(self))
+        except DoesNotExistError:
+            pass
         if self.collection_exists():
             raise NotADataObjectError(
                 "Error retrieving data object, path is linked to a collection."
                 " Use get_collection instead to retrieve the collection."
             )
 
-        raise DataObjectDoesNotExistError(str(IrodsPath))
+        raise DataObjectDoesNotExistError(str(self))
 
     def open(self, mode="r", **kwargs):
         """Open a data object for reading or writing.
@@ -463,13 +474,14 @@ class IrodsPath:
         IrodsPath(~, x)
 
         """
+        coll = self.collection
         all_data_objects: dict[str, list[IrodsPath]] = defaultdict(list)
-        prc_data_objects = _get_data_objects(self.session, self.collection, depth=depth)
+        prc_data_objects = _get_data_objects(self.session, coll, depth=depth)
         for path, name, size, checksum in prc_data_objects:
-            abs_path = IrodsPath(self.session, path).absolute()
+            # Collection names from the iCAT are already absolute and normalized.
             ipath = CachedIrodsPath(self.session, size, True, checksum, path, name)
-            all_data_objects[str(abs_path)].append(ipath)
-        all_collections = _get_subcoll_paths(self.session, self.collection, depth=depth)
+            all_data_objects[path].append(ipath)
+        all_collections = _get_subcoll_paths(self.session, coll, depth=depth)
         all_collections = sorted(all_collections, key=str)
         sub_collections: dict[str, list[IrodsPath]] = defaultdict(list)
         for cur_col in all_collections:
@@ -510,14 +522,16 @@ class IrodsPath:
         623
 
         """
-        if not self.exists():
+        try:
+            item = self._get_item()
+        except DoesNotExistError as exc:
             raise FileNotFoundError(
                 f"Path '{str(self)}' does not exist;"
                 " it is neither a collection nor a dataobject."
-            )
-        if self.dataobject_exists():
-            return self.dataobject.size
-        all_objs = _get_data_objects(self.session, self.collection)
+            ) from exc
+        if isinstance(item, irods.data_object.iRODSDataObject):
+            return item.size
+        all_objs = _get_data_objects(self.session, item)
         return sum(size for _, _, size, _ in all_objs)
 
     @property
@@ -543,13 +557,14 @@ class IrodsPath:
         'sha2:XGiECYZOtUfP9lnCGyZaBBkBGLaJJw1p6eoc0GxLeKU='
 
         """
-        if self.dataobject_exists():
+        try:
             dataobj = self.dataobject
-            return dataobj.checksum if dataobj.checksum is not None else dataobj.chksum()
-        if self.collection_exists():
-            raise NotADataObjectError("Cannot take checksum of a collection.")
-        raise DoesNotExistError(
-            f"Cannot take checksum of {str(self)} irods path which does not exist.")
+        except NotADataObjectError as exc:
+            raise NotADataObjectError("Cannot take checksum of a collection.") from exc
+        except DoesNotExistError as exc:
+            raise DoesNotExistError(
+                f"Cannot take checksum of {str(self)} irods path which does not exist.") from exc
+        return dataobj.checksum if dataobj.checksum is not None else dataobj.chksum()
 
     @property
     def meta(self) -> MetaData:
@@ -565,14 +580,27 @@ class IrodsPath:
             When the path does not point to a data object or collection.
 
         """
-        if self.dataobject_exists():
-            return MetaData(self.dataobject)
-        if self.collection_exists():
-            return MetaData(self.collection)
-        raise DoesNotExistError(
-            "Cannot get metadata for path that is neither dataobject or collection:"
-            f" {self}")
+        try:
+            return MetaData(self._get_item())
+        except DoesNotExistError as exc:
+            raise DoesNotExistError(
+                "Cannot get metadata for path that is neither dataobject or collection:"
+                f" {self}") from exc
 
+    def _get_item(self) -> Union[irods.data_object.iRODSDataObject,
+                                 irods.collection.iRODSCollection]:
+        """Retrieve the collection or data object without separate existence checks.
+
+        Raises
+        ------
+        DoesNotExistError:
+            When the path does not point to a data object or collection.
+
+        """
+        try:
+            return self.session.irods_session.collections.get(str(self))
+        except CollectionDoesNotExistError:
+            return self.session.irods_session.data_objects.get(str(self))
 
 
 def _recursive_walk(cur_col: IrodsPath, sub_collections: dict[str, list[IrodsPath]],
@@ -646,6 +674,13 @@ class CachedIrodsPath(IrodsPath):
         """See IrodsPath."""
         return not self._is_dataobj
 
+    def _get_item(self) -> Union[irods.data_object.iRODSDataObject,
+                                 irods.collection.iRODSCollection]:
+        """See IrodsPath."""
+        if self._is_dataobj:
+            return self.session.irods_session.data_objects.get(str(self))
+        return super()._get_item()
+
 
 def _get_data_objects(
     session, coll: irods.collection.iRODSCollection,
@@ -669,19 +704,33 @@ def _get_data_objects(
 
     """
     # all objects in the collection
-    objs = [(obj.collection.path, obj.name, obj.size, obj.checksum) for obj in coll.data_objects]
+    objs = _query_data_objects(session, icat.COLL_NAME == coll.path)
     if depth == 1:
         return objs
 
     # all objects in subcollections
+    objs.extend(_query_data_objects(session, icat.LIKE(icat.COLL_NAME, coll.path + "/%")))
+    return objs
+
+
+def _query_data_objects(session, coll_filter) -> list[tuple[str, str, int, str]]:
+    """Query only the columns needed for listing, instead of full iRODSDataObjects.
+
+    Replicas with a different size or checksum give separate rows, only the first
+    row of each data object is kept.
+    """
     data_query = session.irods_session.query(
         icat.COLL_NAME, icat.DATA_NAME, DataObject.size, DataObject.checksum
     )
-    data_query = data_query.filter(icat.LIKE(icat.COLL_NAME, coll.path + "/%"))
+    data_query = data_query.filter(coll_filter)
+    objs = []
+    seen = set()
     for res in data_query.get_results():
         path, name, size, checksum = res.values()
+        if (path, name) in seen:
+            continue
+        seen.add((path, name))
         objs.append((path, name, size, checksum))
-
     return objs
 
 
@@ -40,10 +40,9 @@ class Permissions:
             acl_dict[f"{perm.user_name}#{perm.user_zone}"].append(
                 f"{perm.access_name}\t{perm.user_type}"
             )
-        acl = ""
-        for key, value in sorted(acl_dict.items()):
-            v_str = "\n\t".join(value)
-            acl += f"{key}\n\t{v_str}\n"
+        acl = "".join(
+            f"{key}\n\t" + "\n\t".join(value) + "\n" for key, value in sorted(acl_dict.items())
+        )
 
         if isinstance(self.item, irods.collection.iRODSCollection):
             coll = self.session.irods_session.collections.get(self.item.path)
@@ -184,33 +184,31 @@ def search_data(  # pylint: disable=too-many-branches
     if checksum is not None:
         _checksum_filter(checksum, queries)
 
-    query_results = []
-    for q in queries:
-        query_results.extend(list(q[0]))
-
     # gather results, data_query and data_name_query can contain the same results
-    results = [dict(s) for s in set(frozenset(d.items()) for d in query_results)]
-    for item in results:
-        if isinstance(item, dict):
-            for meta_key in list(item.keys()):
-                item[meta_key.icat_key] = item.pop(meta_key)
-
-    # Convert the results to IrodsPath objects.
     ipath_results: List[CachedIrodsPath] = []
-    for res in results:
-        if "DATA_NAME" in res:
-            ipath_results.append(
-                CachedIrodsPath(
-                    session,
-                    res["DATA_SIZE"],
-                    True,
-                    res["D_DATA_CHECKSUM"],
-                    res["COLL_NAME"],
-                    res["DATA_NAME"],
+    seen = set()
+    for query, q_type in queries:
+        for res in query:
+            coll_name = res[icat.COLL_NAME]
+            data_name = res[icat.DATA_NAME] if q_type == "data_object" else None
+            if (coll_name, data_name) in seen:
+                continue
+            seen.add((coll_name, data_name))
+
+            # Convert the results to IrodsPath objects.
+            if data_name is None:
+                ipath_results.append(CachedIrodsPath(session, None, False, None, coll_name))
+            else:
+                ipath_results.append(
+                    CachedIrodsPath(
+                        session,
+                        res[icat.DATA_SIZE],
+                        True,
+                        res[icat.DATA_CHECKSUM],
+                        coll_name,
+                        data_name,
+                    )
                 )
-            )
-        else:
-            ipath_results.append(CachedIrodsPath(session, None, False, None, res["COLL_NAME"]))
     return ipath_results
 
 
@@ -25,7 +25,7 @@ from ibridges import icat_columns as icat
 APP_NAME = "ibridges"
 
 
-class Session:
+class Session:  # pylint: disable=too-many-instance-attributes
     """Session to connect and perform operations on the iRODS server.
 
     When the session is initialized, you are connected succesfully to the iRODS server.
@@ -97,6 +97,8 @@ class Session:
         self._password = password
         self._irods_env: dict = irods_env
         self._irods_env_path = irods_env_path
+        self._user_info: Optional[tuple[list, list]] = None
+        self._server_version: Optional[tuple] = None
         self.irods_session = self.connect()
         if irods_home is not None:
             self.home = irods_home
@@ -106,7 +108,7 @@ class Session:
     def __enter__(self):
         """Connect to the iRODS server if not already connected."""
         if not self.has_valid_irods_session():
-            self.connect()
+            self.irods_session = self.connect()
         return self
 
     def __exit__(self, exc_type, exc_value, exc_trace_back):
@@ -210,11 +212,9 @@ class Session:
         # authentication with irods environment and password
         if self._password is None or self._password == "":
             # use cached password of .irodsA built into prc
-            # print("Auth without password")
             return self.authenticate_using_auth_file()
 
         # irods environment and given password
-        # print("Auth with password")
         return self.authenticate_using_password()
 
     def close(self):
@@ -225,8 +225,14 @@ class Session:
         """
         if self.irods_session is not None:
             self.irods_session.do_configure = {}
-            self.irods_session.cleanup()
-            self.irods_session = None
+            try:
+                self.irods_session.cleanup()
+            except OSError:
+                # The server may already have dropped the connection, which leaves nothing to close.
+                pass
+            finally:
+                self.irods_session = None
+        self._server_version = None
 
     def authenticate_using_password(self) -> iRODSSession:
         """Authenticate with the iRODS server using a password.
@@ -240,11 +246,12 @@ class Session:
                 connection_timeout=self.connection_timeout,
                 application_name=APP_NAME,
             )
-            _ = irods_session.server_version
+            server_version = irods_session.server_version
         except Exception as e:
             raise _translate_irods_error(e) from e
-        if irods_session.server_version == ():
+        if server_version == ():
             raise LoginError("iRODS server does not return a server version.")
+        self._server_version = server_version
         return irods_session
 
     def authenticate_using_auth_file(self) -> iRODSSession:
@@ -274,13 +281,14 @@ class Session:
                         )
                     finally:
                         os.unlink(temp_ienv_path)
-            _ = irods_session.server_version  # pylint: disable=possibly-used-before-assignment
+            server_version = irods_session.server_version  # pylint: disable=possibly-used-before-assignment
         except NonAnonymousLoginWithoutPassword as e:
             raise ValueError("No cached password found.") from e
         except Exception as e:
             raise _translate_irods_error(e) from e
-        if irods_session.server_version == ():
+        if server_version == ():
             raise LoginError("iRODS server does not return a server version.")
+        self._server_version = server_version
         return irods_session
 
     def write_pam_password(self):
@@ -334,30 +342,37 @@ class Session:
         Returns
         -------
             Server version: (major, minor, patch).
+            The version is cached after connecting, so it is only queried once per connection.
 
         """
-        try:
-            return self.irods_session.server_version
-        except Exception as e:
-            raise _translate_irods_error(e) from e
+        if self._server_version is None:
+            try:
+                self._server_version = self.irods_session.server_version
+            except Exception as e:
+                raise _translate_irods_error(e) from e
+        return self._server_version
 
     def get_user_info(self) -> tuple[list, list]:
         """Query for user type and groups.
 
+        The result is cached, so only the first call queries the iRODS server.
+
         Returns
         -------
             Tuple containing (iRODS user type names, iRODS group names)
 
         """
-        query = self.irods_session.query(icat.USER_TYPE).filter(
-            icat.LIKE(icat.USER_NAME, self.username)
-        )
-        user_type = [list(result.values())[0] for result in query.get_results()][0]
-        query = self.irods_session.query(icat.USER_GROUP_NAME).filter(
-            icat.LIKE(icat.USER_NAME, self.username)
-        )
-        user_groups = [list(result.values())[0] for result in query.get_results()]
-        return user_type, user_groups
+        if self._user_info is None:
+            query = self.irods_session.query(icat.USER_TYPE).filter(
+                icat.LIKE(icat.USER_NAME, self.username)
+            )
+            user_type = [list(result.values())[0] for result in query.get_results()][0]
+            query = self.irods_session.query(icat.USER_GROUP_NAME).filter(
+                icat.LIKE(icat.USER_NAME, self.username)
+            )
+            user_groups = [list(result.values())[0] for result in query.get_results()]
+            self._user_info = (user_type, user_groups)
+        return self._user_info
 
 
 class LoginError(AttributeError):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import os
 from collections.abc import Sequence
 from hashlib import md5, sha256
 from pathlib import Path
@@ -152,6 +153,16 @@ def find_environment_provider(env_providers: list, server_name: str) -> object:
     )
 
 
+def _read_buffer_size(file_size: int) -> int:
+    """Choose the read buffer size for checksumming a local file of the given size."""
+    if file_size < 1024**2:
+        # Small files are read in a single call, without allocating a large buffer.
+        return file_size + 1
+    if file_size < 32 * 1024**2:
+        return 1024**2
+    return 4 * 1024**2
+
+
 def calc_checksum(filepath: Union[Path, str, IrodsPath], checksum_type="sha2"):
     """Calculate the checksum for an iRODS dataobject or local file.
 
@@ -175,8 +186,8 @@ def calc_checksum(filepath: Union[Path, str, IrodsPath], checksum_type="sha2"):
         f_hash = sha256()
     else:
         f_hash = md5()
-    memv = memoryview(bytearray(128 * 1024))
     with open(filepath, "rb", buffering=0) as file:
+        memv = memoryview(bytearray(_read_buffer_size(os.fstat(file.fileno()).st_size)))
         for item in iter(lambda: file.readinto(memv), 0):
             f_hash.update(memv[:item])
     if checksum_type == "md5":
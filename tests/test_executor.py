@@ -0,0 +1,123 @@
+import threading
+import time
+
+import pytest
+
+import ibridges.executor
+from ibridges.executor import Operations, _transfer_files
+
+
+class MockTransfer:
+    def __init__(self, fail_on=None, delay=0.0):
+        self.fail_on = fail_on
+        self.delay = delay
+        self.calls = []
+        self.finished = []
+        self.lock = threading.Lock()
+
+    def __call__(self, session, source, dest, overwrite, ignore_err, options, resc_name, pbar,
+                 verify_checksum):
+        with self.lock:
+            self.calls.append((source, dest, options))
+        if source == self.fail_on:
+            raise PermissionError(f"Cannot transfer {source}")
+        if options is not None:
+            options["changed"] = True
+        time.sleep(self.delay)
+        with self.lock:
+            self.finished.append(source)
+
+
+@pytest.mark.parametrize("n_workers", [1, 4])
+def test_transfer_all(monkeypatch, n_workers):
+    monkeypatch.setattr(ibridges.executor, "NUM_TRANSFER_WORKERS", n_workers)
+    transfer = MockTransfer()
+    transfers = [(f"src{i}", f"dest{i}") for i in range(50)]
+    _transfer_files(transfer, None, transfers, False, None, "", None)
+    assert sorted(call[:2] for call in transfer.calls) == sorted(transfers)
+    if n_workers == 1:
+        assert [call[:2] for call in transfer.calls] == transfers
+
+
+def test_transfer_ordering():
+    # Transfers are started in order, even if they run at the same time.
+    transfer = MockTransfer(delay=0.001)
+    transfers = [(f"src{i}", f"dest{i}") for i in range(50)]
+    _transfer_files(transfer, None, transfers, False, None, "", None)
+    started = [int(call[0][3:]) for call in transfer.calls]
+    assert sorted(started) == list(range(len(transfers)))
+    assert all(abs(i_transfer - i_start) < ibridges.executor.NUM_TRANSFER_WORKERS
+               for i_start, i_transfer in enumerate(started))
+
+
+def test_transfer_same_destination():
+    # The destination can be a collection or directory, so files with the same destination
+    # are all transferred.
+    transfer = MockTransfer()
+    transfers = [("src0", "dest0"), ("src1", "dest1"), ("src2", "dest0")]
+    _transfer_files(transfer, None, transfers, False, None, "", None)
+    assert sorted(call[:2] for call in transfer.calls) == sorted(transfers)
+
+
+@pytest.mark.parametrize("n_workers", [1, 4])
+def test_transfer_error(monkeypatch, n_workers):
+    monkeypatch.setattr(ibridges.executor, "NUM_TRANSFER_WORKERS", n_workers)
+    transfer = MockTransfer(fail_on="src0", delay=0.01)
+    transfers = [(f"src{i}", f"dest{i}") for i in range(200)]
+    with pytest.raises(PermissionError, match="src0"):
+        _transfer_files(transfer, None, transfers, False, None, "", None)
+    # The queued transfers are cancelled after the first error.
+    assert len(transfer.calls) <= n_workers
+
+
+def test_transfer_options_copy():
+    transfer = MockTransfer()
+    options = {"key": "value"}
+    transfers = [(f"src{i}", f"dest{i}") for i in range(10)]
+    _transfer_files(transfer, None, transfers, False, options, "", None)
+    assert options == {"key": "value"}
+    all_options = [call[2] for call in transfer.calls]
+    assert len({id(opt) for opt in all_options}) == len(transfers)
+    assert all(opt == {"key": "value", "changed": True} for opt in all_options)
+
+
+class InterruptedTransfers(list):
+    """Transfer list that is interrupted once the first transfer is running."""
+
+    def __init__(self, transfers, transfer):
+        super().__init__(transfers)
+        self.transfer = transfer
+
+    def __iter__(self):
+        yield from super().__iter__()
+        while not self.transfer.calls:
+            time.sleep(0.001)
+        raise KeyboardInterrupt()
+
+
+def test_transfer_interrupt():
+    n_threads = threading.active_count()
+    transfer = MockTransfer(delay=0.05)
+    transfers = InterruptedTransfers([(f"src{i}", f"dest{i}") for i in range(10)], transfer)
+    with pytest.raises(KeyboardInterrupt):
+        _transfer_files(transfer, None, transfers, False, None, "", None)
+    # The queued transfers are cancelled, the running ones are finished before returning.
+    assert 0 < len(transfer.calls) <= ibridges.executor.NUM_TRANSFER_WORKERS
+    assert sorted(transfer.finished) == sorted(call[0] for call in transfer.calls)
+    assert threading.active_count() == n_threads
+
+
+@pytest.mark.parametrize("whole_tree", [[True, True], [True, False], [False, False]])
+def test_meta_download_bulk(monkeypatch, tmp_path, whole_tree):
+    # Only archives of a whole tree are fetched with the bulk queries.
+    bulk_roots = []
+    monkeypatch.setattr(ibridges.executor, "_query_tree_metadata",
+                        lambda root: bulk_roots.append(root) or {})
+    monkeypatch.setattr(ibridges.executor, "_add_to_metadict",
+                        lambda meta_dict, ipath, root_path, tree_meta: None)
+    ops = Operations()
+    for i_item, item_whole_tree in enumerate(whole_tree):
+        ops.add_meta_download("/zone/root", f"/zone/root/item{i_item}", tmp_path / "meta.json",
+                              whole_tree=item_whole_tree)
+    ops.execute_meta_download()
+    assert bulk_roots == (["/zone/root"] if all(whole_tree) else [])
@@ -3,6 +3,7 @@ from pathlib import PurePosixPath
 from pytest import mark
 
 from ibridges import IrodsPath
+from ibridges.path import _query_data_objects
 
 
 class MockIrodsSession:
@@ -45,6 +46,7 @@ def test_absolute_path(input, abs_path, name, parent):
     session = MockIrodsSession()
     ipath = IrodsPath(session, *input)
     assert str(ipath.absolute()) == abs_path
+    assert str(ipath) == abs_path
     assert ipath.name == name
     assert isinstance(ipath.parent, IrodsPath)
     assert str(ipath.parent._path) == parent, str(ipath.parent)
@@ -60,3 +62,35 @@ def test_absolute_path(input, abs_path, name, parent):
 def test_join_path(path, to_join, result):
     irods_path = IrodsPath(MockIrodsSession(), path)
     assert str(irods_path.joinpath(*to_join)._path) == result
+
+
+class MockQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *_):
+        return self
+
+    def get_results(self):
+        return iter(self.rows)
+
+
+class MockQuerySession:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def query(self, *columns):
+        return MockQuery([dict(zip(columns, row)) for row in self.rows])
+
+
+def test_query_data_objects_replicas():
+    coll = "/testzone/home/testuser/coll"
+    session = MockIrodsSession()
+    # The second replica of x.txt has no registered checksum and gives a separate row.
+    session.irods_session = MockQuerySession([
+        (coll, "x.txt", 10, "sha2:abc"),
+        (coll, "x.txt", 10, None),
+        (coll, "y.txt", 5, "sha2:def"),
+    ])
+    objs = _query_data_objects(session, None)
+    assert objs == [(coll, "x.txt", 10, "sha2:abc"), (coll, "y.txt", 5, "sha2:def")]
@@ -0,0 +1,59 @@
+import irods.meta
+import pytest
+
+from ibridges.meta import MetaData
+
+
+class MockMetaCollection:
+    def __init__(self, meta_list):
+        self._meta = meta_list
+        self.atomic_calls = []
+
+    def __len__(self):
+        return len(self._meta)
+
+    def items(self):
+        return self._meta
+
+    def apply_atomic_operations(self, *avu_ops):
+        self.atomic_calls.append(avu_ops)
+        for op in avu_ops:
+            assert op.operation == "add"
+        self._meta = self._meta + [op.avu for op in avu_ops]
+
+
+class MockItem:
+    def __init__(self, meta_list):
+        self.metadata = MockMetaCollection(meta_list)
+
+
+def test_from_dict_atomic():
+    item = MockItem([irods.meta.iRODSMeta("present", "value", None)])
+    meta = MetaData(item)
+    meta.from_dict({"metadata": [
+        ("new", "value", "kg"),
+        ("new", "value", "kg"),
+        ("org_blacklisted", "value", ""),
+        ("present", "value", ""),
+        ("", "empty_key", ""),
+        ("other", "value", ""),
+    ]})
+    assert len(item.metadata.atomic_calls) == 1
+    added = [(op.avu.name, op.avu.value, op.avu.units) for op in item.metadata.atomic_calls[0]]
+    assert added == [("new", "value", "kg"), ("other", "value", "")]
+    assert sorted(tuple(entry) for entry in meta) == [
+        ("new", "value", "kg"), ("other", "value", ""), ("present", "value", "")]
+
+
+def test_from_dict_nothing_new():
+    item = MockItem([irods.meta.iRODSMeta("present", "value", "kg")])
+    MetaData(item).from_dict({"metadata": [("present", "value", "kg")]})
+    assert item.metadata.atomic_calls == []
+
+
+@pytest.mark.parametrize("wrong_entry", [(10, "value", ""), ("key", 10, ""), ("key", "value", 10)])
+def test_from_dict_wrong_type(wrong_entry):
+    item = MockItem([])
+    with pytest.raises(TypeError):
+        MetaData(item).from_dict({"metadata": [("new", "value", "kg"), wrong_entry]})
+    assert item.metadata.atomic_calls == []